@@ -0,0 +1,100 @@
+/**
+ * Game Page Object
+ *
+ * Encapsulates the menu -> intro -> gameplay flow shared by the game specs
+ * so each spec only describes what it verifies.
+ */
+
+import { expect, type Locator, type Page, type PageScreenshotOptions } from '@playwright/test';
+import { TEST_IDS } from './test-data';
+
+declare global {
+  interface Window {
+    // Published by the narrative overlay as the intro advances
+    __dialogueIdx?: number;
+    // Set by BabylonSceneService once the initial scene is ready
+    __ready?: boolean;
+  }
+}
+
+// Verification shots are reviewed by eye, not diffed, so JPEG is cheaper to encode and store
+export const VERIFICATION_SCREENSHOT = {
+  type: 'jpeg',
+  quality: 70,
+  animations: 'disabled',
+  caret: 'hide',
+} as const satisfies PageScreenshotOptions;
+
+export class GamePage {
+  readonly startButton: Locator;
+  readonly dialogueOverlay: Locator;
+  readonly dialogueBox: Locator;
+  readonly hud: Locator;
+
+  constructor(readonly page: Page) {
+    this.startButton = page.getByTestId(TEST_IDS.startButton);
+    this.dialogueOverlay = page.getByTestId(TEST_IDS.dialogueOverlay);
+    this.dialogueBox = this.dialogueOverlay.locator('.narrative-dialogue-box');
+    this.hud = page.getByTestId(TEST_IDS.hud);
+  }
+
+  async navigateToGame(): Promise<void> {
+    await this.page.goto('/');
+    await expect(this.startButton).toBeVisible({ timeout: 15000 });
+  }
+
+  /** Wait for the Babylon scene to report ready instead of guessing at load time. */
+  async waitForSceneReady(): Promise<void> {
+    await this.page.waitForFunction(() => window.__ready === true, undefined, { timeout: 30000 });
+  }
+
+  async startGame(): Promise<void> {
+    await this.startButton.click();
+    await expect(this.dialogueOverlay).toBeVisible({ timeout: 15000 });
+  }
+
+  /** Walk the intro line by line with Space, reacting to each dialogue index change. */
+  async advanceIntro(): Promise<void> {
+    const { page, dialogueOverlay } = this;
+    const introEnded = page.evaluate(
+      () =>
+        new Promise<void>((resolve) =>
+          window.addEventListener('dialogue:end', () => resolve(), { once: true })
+        )
+    );
+    // Mark the rejection handled so a failure inside the loop is not buried under a
+    // second error when the page closes; the await below still surfaces it
+    introEnded.catch(() => {});
+    const lineComplete = this.dialogueBox.locator('.progress');
+    const readIdx = () => page.evaluate(() => window.__dialogueIdx ?? 0);
+    for (let step = 0; step < 20 && (await dialogueOverlay.isVisible()); step++) {
+      // First press finishes the typewriter, second moves to the next line
+      if (!(await lineComplete.isVisible())) {
+        await page.keyboard.press('Space');
+      }
+      await expect(lineComplete).toBeVisible();
+      const prev = await readIdx();
+      await page.keyboard.press('Space');
+      expect(await readIdx(), 'Space should advance exactly one line').toBe(prev + 1);
+    }
+    if (await dialogueOverlay.isVisible()) {
+      throw new Error('Intro dialogue still on screen after 20 advances');
+    }
+    await introEnded;
+    await expect(this.hud).toBeVisible({ timeout: 15000 });
+  }
+
+  /** Skip the intro with the on-screen button, or with Escape when `via` is 'keyboard'. */
+  async skipIntro(via: 'button' | 'keyboard' = 'button'): Promise<void> {
+    if (via === 'keyboard') {
+      await this.page.keyboard.press('Escape');
+    } else {
+      await this.page.getByRole('button', { name: 'SKIP INTRO >>' }).click();
+    }
+    await expect(this.hud).toBeVisible({ timeout: 15000 });
+  }
+
+  async captureScreenshot(name: string): Promise<void> {
+    await this.page.screenshot({ ...VERIFICATION_SCREENSHOT, path: `verification/${name}.jpg` });
+  }
+}
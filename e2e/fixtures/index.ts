@@ -0,0 +1,58 @@
+/**
+ * Game Test Fixtures
+ *
+ * Playwright launches Chromium once per worker and hands every test a fresh
+ * BrowserContext, so game specs never pay a browser cold start per test.
+ * Game specs import `test`/`expect` from here so context-level setup lives
+ * in one place.
+ */
+
+import { test as base, expect } from '@playwright/test';
+import { GamePage } from './game-page';
+
+// Web fonts are the only third-party requests the game makes and no spec asserts on them
+const WEB_FONT_HOSTS = /^https:\/\/fonts\.(googleapis|gstatic)\.com\//;
+
+// Browser console output is chatty (WebGL warnings), so only echo it when asked
+const LOG_BROWSER_CONSOLE = !!process.env.E2E_CONSOLE;
+
+interface GameFixtures {
+  gamePage: GamePage;
+  consoleErrors: string[];
+}
+
+export const test = base.extend<GameFixtures>({
+  context: async ({ context }, use) => {
+    // Serve an empty stylesheet rather than aborting so no network errors reach the console;
+    // with no @font-face rules left, the font files themselves are never requested
+    await context.route(WEB_FONT_HOSTS, (route) =>
+      route.fulfill({ status: 200, contentType: 'text/css', body: '' })
+    );
+    if (LOG_BROWSER_CONSOLE) {
+      context.on('console', (msg) => console.log(`[browser ${msg.type()}] ${msg.text()}`));
+      context.on('weberror', (error) =>
+        console.log(`[browser pageerror] ${error.error().message}`)
+      );
+    }
+    await use(context);
+  },
+
+  // Registered on the context so every page in the test reports into one list
+  consoleErrors: async ({ context }, use) => {
+    const errors: string[] = [];
+    context.on('console', (msg) => {
+      if (msg.type() === 'error') {
+        errors.push(msg.text());
+      }
+    });
+    await use(errors);
+  },
+
+  gamePage: async ({ page }, use) => {
+    await use(new GamePage(page));
+  },
+});
+
+export { expect };
+export { GamePage, VERIFICATION_SCREENSHOT } from './game-page';
+export { TEST_IDS } from './test-data';
@@ -0,0 +1,13 @@
+/**
+ * Test Data
+ *
+ * Shared constants for the game specs. Selectors are defined once here so
+ * every spec and page object resolves the same hooks.
+ */
+
+/** data-testid hooks rendered by the game UI. */
+export const TEST_IDS = {
+  startButton: 'start-btn',
+  dialogueOverlay: 'dialogue-overlay',
+  hud: 'hud',
+} as const;
@@ -0,0 +1,39 @@
+/**
+ * Global Setup
+ *
+ * Checks the game server with plain HTTP before any worker launches
+ * Chromium, so an unreachable server fails the run in seconds instead of
+ * surfacing as a navigation timeout inside every test.
+ */
+
+import type { FullConfig } from '@playwright/test';
+
+const POLL_INTERVAL_MS = 100;
+const REQUEST_TIMEOUT_MS = 1000;
+const DEADLINE_MS = 10000;
+
+export default async function globalSetup(config: FullConfig): Promise<void> {
+  const baseURL = config.projects[0]?.use.baseURL;
+  if (!baseURL) return;
+
+  // Node's fetch keeps the connection alive between polls
+  const deadline = Date.now() + DEADLINE_MS;
+  let lastError = 'no response';
+  while (Date.now() < deadline) {
+    try {
+      const response = await fetch(baseURL, {
+        method: 'HEAD',
+        redirect: 'manual',
+        signal: AbortSignal.timeout(REQUEST_TIMEOUT_MS),
+      });
+      // Like Playwright's webServer probe, any non-5xx answer (405 on HEAD, 3xx) means it is up
+      if (response.status < 500) return;
+      lastError = `HTTP ${response.status}`;
+    } catch (error) {
+      lastError = error instanceof Error ? error.message : String(error);
+    }
+    await new Promise((resolve) => setTimeout(resolve, POLL_INTERVAL_MS));
+  }
+
+  throw new Error(`Game server at ${baseURL} is not reachable (${lastError})`);
+}
@@ -3,6 +3,10 @@ import { defineConfig, devices } from '@playwright/test';
 
 const workspaceRoot = resolve(__dirname, '..');
 
+// Point BASE_URL at an already running server to skip starting ng serve
+const externalBaseURL = process.env.BASE_URL;
+const baseURL = externalBaseURL ?? 'http://localhost:4200';
+
 const projects = [
   // Game tests (existing)
   {
@@ -10,17 +14,23 @@ const projects = [
     testMatch: /(gameplay|canal)\.spec\.ts/,
     use: {
       ...devices['Desktop Chrome'],
-      baseURL: 'http://localhost:4200',
+      baseURL,
+      launchOptions: {
+        // Let the Babylon render loop run unthrottled so scene readiness isn't paced by vsync
+        args: ['--disable-gpu-vsync', '--disable-frame-rate-limit'],
+      },
     },
   },
 ];
 
 export default defineConfig({
   testDir: './tests',
+  globalSetup: './global-setup.ts',
   fullyParallel: true,
   forbidOnly: !!process.env.CI,
   retries: process.env.CI ? 2 : 0,
-  workers: process.env.CI ? 1 : undefined,
+  // Specs are independent flows against one shared dev server, so let CI fan out too
+  workers: process.env.CI ? '50%' : undefined,
   reporter: 'html',
 
   // Increase timeout for WebGL initialization
@@ -35,20 +45,23 @@ export default defineConfig({
   },
 
   use: {
-    trace: 'on-first-retry',
+    // Record from the first attempt but only write the archive when that attempt fails
+    trace: 'retain-on-first-failure',
     screenshot: 'only-on-failure',
     video: 'retain-on-failure',
   },
 
   projects,
 
-  webServer: [
-    {
-      command: 'pnpm ng serve --port 4200',
-      url: 'http://localhost:4200',
-      cwd: workspaceRoot,
-      reuseExistingServer: !process.env.CI,
-      timeout: 120000,
-    },
-  ],
+  webServer: externalBaseURL
+    ? undefined
+    : [
+        {
+          command: 'pnpm ng serve --port 4200',
+          url: baseURL,
+          cwd: workspaceRoot,
+          reuseExistingServer: !process.env.CI,
+          timeout: 120000,
+        },
+      ],
 });
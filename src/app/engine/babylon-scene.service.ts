@@ -1,5 +1,6 @@
 import { Injectable, inject, NgZone } from '@angular/core';
 import {
+  type AbstractMesh,
   ArcRotateCamera,
   Color4,
   Engine,
@@ -27,6 +28,13 @@ import {
   QuestMarkerManager,
 } from './quest-markers';
 
+declare global {
+  interface Window {
+    /** Set once the initial scene has compiled its materials and rendered. */
+    __ready?: boolean;
+  }
+}
+
 @Injectable({ providedIn: 'root' })
 export class BabylonSceneService {
   private engine: Engine | null = null;
@@ -91,16 +99,22 @@ export class BabylonSceneService {
 
     this.characterLoader = new CharacterLoader(this.scene);
 
-    const { meshes, animations } = await this.characterLoader.load({
-      modelPath: '/assets/characters/main/kai/animations/combat_stance.glb',
-      animationPaths: ['/assets/characters/main/kai/animations/runfast.glb'],
-      position: new Vector3(0, 0, 0),
-      scale: 1,
-      initialAnimation: 'combat',
-      castShadow: true,
-    });
-
-    this.animationController = new CharacterAnimationController(animations);
+    // A missing character model must not take down the rest of the scene
+    let meshes: AbstractMesh[] = [];
+    try {
+      const character = await this.characterLoader.load({
+        modelPath: '/assets/characters/main/kai/animations/combat_stance.glb',
+        animationPaths: ['/assets/characters/main/kai/animations/runfast.glb'],
+        position: new Vector3(0, 0, 0),
+        scale: 1,
+        initialAnimation: 'combat',
+        castShadow: true,
+      });
+      meshes = character.meshes;
+      this.animationController = new CharacterAnimationController(character.animations);
+    } catch (error) {
+      console.error('Failed to load character:', error);
+    }
 
     this.directionalLight = new DirectionalLightWithShadows(this.scene);
     this.directionalLight.create({
@@ -110,10 +124,17 @@ export class BabylonSceneService {
       shadowCasters: meshes,
     });
 
-    this.playerController = new PlayerController(this.scene, meshes[0], this.animationController, {
-      speed: PHYSICS.baseSpeed / 3,
-      bounds: { minX: -20, maxX: 20, minZ: -20, maxZ: 20 },
-    });
+    if (meshes[0] && this.animationController) {
+      this.playerController = new PlayerController(
+        this.scene,
+        meshes[0],
+        this.animationController,
+        {
+          speed: PHYSICS.baseSpeed / 3,
+          bounds: { minX: -20, maxX: 20, minZ: -20, maxZ: 20 },
+        }
+      );
+    }
 
     this.questMarkerManager = new QuestMarkerManager(this.scene);
     this.dataShardManager = new DataShardManager(this.scene);
@@ -130,6 +151,11 @@ export class BabylonSceneService {
       });
     });
 
+    this.scene.executeWhenReady(() => {
+      window.__ready = true;
+      window.dispatchEvent(new Event('game:ready'));
+    });
+
     window.addEventListener('resize', this.handleResize);
   }
 
@@ -213,6 +239,7 @@ export class BabylonSceneService {
 
   dispose() {
     window.removeEventListener('resize', this.handleResize);
+    window.__ready = false;
     this.proceduralBackground?.dispose();
     this.foregroundProps?.dispose();
     this.midgroundFacades?.dispose();
@@ -1,6 +1,7 @@
 import {
   Component,
   EventEmitter,
+  HostListener,
   Input,
   type OnChanges,
   Output,
@@ -9,6 +10,13 @@ import {
 } from '@angular/core';
 import type { NarrativeLine } from '../content/intro-script';
 
+declare global {
+  interface Window {
+    /** Index of the narrative line on screen; equals the script length once finished. */
+    __dialogueIdx?: number;
+  }
+}
+
 @Component({
   selector: 'app-narrative-overlay',
   standalone: false,
@@ -30,7 +38,7 @@ export class NarrativeOverlayComponent implements OnChanges {
     if (script) {
       this.reset();
       if (!this.script || this.script.length === 0) {
-        this.complete.emit();
+        this.finish();
       } else {
         this.typeNext();
       }
@@ -41,25 +49,45 @@ export class NarrativeOverlayComponent implements OnChanges {
     return this.script?.[this.index] || { speaker: 'SYSTEM', text: '...', image: '' };
   }
 
+  @HostListener('window:keydown.space', ['$event'])
+  handleKeyAdvance(event: Event): void {
+    event.preventDefault();
+    this.handleNext();
+  }
+
+  @HostListener('window:keydown.escape')
+  handleKeySkip(): void {
+    this.skip();
+  }
+
   handleNext(): void {
     if (this.charIndex < this.currentLine.text.length) {
       this.displayText = this.currentLine.text;
       this.charIndex = this.currentLine.text.length;
+      // Cancel the pending typewriter tick and start the reading-delay auto-advance instead
+      this.typeNext();
       return;
     }
 
     if (this.index < this.script.length - 1) {
       this.index += 1;
+      window.__dialogueIdx = this.index;
       this.displayText = '';
       this.charIndex = 0;
       this.typeNext();
     } else {
-      this.complete.emit();
+      this.finish();
     }
   }
 
   skip(): void {
+    this.finish();
+  }
+
+  private finish(): void {
     this.clearTimers();
+    window.__dialogueIdx = this.script?.length ?? 0;
+    window.dispatchEvent(new CustomEvent('dialogue:end'));
     this.complete.emit();
   }
 
@@ -82,6 +110,7 @@ export class NarrativeOverlayComponent implements OnChanges {
   private reset(): void {
     this.clearTimers();
     this.index = 0;
+    window.__dialogueIdx = 0;
     this.displayText = '';
     this.charIndex = 0;
   }